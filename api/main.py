@@ -3,12 +3,21 @@
 Serves predictions through a REST API endpoint.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import pickle
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Literal
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from operator import attrgetter, itemgetter
+import asyncio
+import joblib
 import numpy as np
+import orjson
 import os
+import sys
 import logging
 
 # Configure logging
@@ -19,26 +28,211 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Insurance Fraud Detection API",
     description="ML API for detecting fraudulent insurance claims",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware for Streamlit integration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware for Streamlit integration, scoped to the UI's origin
+# (comma-separated STREAMLIT_ORIGIN); set it to an empty string to skip CORS
+# entirely when the API is only called server-side
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("STREAMLIT_ORIGIN", "http://localhost:8501").split(",")
+    if origin.strip()
+]
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=False,
+        allow_methods=["GET", "POST"],
+        allow_headers=["content-type"],
+    )
 
-# Global model variable
+# Global model variable and its estimator class name (reported by /info)
 model = None
+model_algorithm = None
+
+# Model artifacts written by FraudDetectionModel.save_model
+MODEL_DIR = os.path.join(os.path.dirname(__file__), "../models")
+MODEL_PATH = os.path.join(MODEL_DIR, "fraud_detection_model.pkl")
+SCALER_PATH = os.path.join(MODEL_DIR, "fraud_detection_model_scaler.npz")
+SCORER_PATH = os.path.join(MODEL_DIR, "fraud_detection_model_scorer.py")
+ONNX_PATH = os.path.join(MODEL_DIR, "fraud_detection_model.onnx")
+
+# Scoring backend: "sklearn" walks the fitted tree_ directly (or calls
+# predict_proba for tree ensembles), "python" uses the straight-line scorer
+# generated by m2cgen at training time, "onnx" runs the exported ONNX graph
+# with onnxruntime, "cython" calls the compiled fraud_scorer extension and
+# "shared" walks a copy of the tree held in shared memory (see
+# SharedTreeModel). python, cython and shared need a single decision tree
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "sklearn")
+
+# Number of uvicorn worker processes started by `python api/main.py`. Each
+# worker runs its own onnxruntime session, so with more than one worker the
+# intra-op thread pools would oversubscribe the CPU; ONNX_THREADS therefore
+# defaults to 1 then and to the CPU count for a single worker
+WORKERS = int(os.getenv("WORKERS", (os.cpu_count() or 2) * 2 + 1))
+ONNX_THREADS = int(os.getenv("ONNX_THREADS", 1 if WORKERS > 1 else os.cpu_count() or 1))
+
+# Fitted StandardScaler parameters (float32 mean and 1/scale, as used by
+# FraudDetectionModel.preprocess_array) saved by save_model; the estimator
+# was trained on scaled features, so every row is scaled before scoring
+_mean32 = None
+_inv_scale32 = None
+
+# Raw tree structure, class labels, generated scorers and ONNX session
+# cached at startup
+_tree = None
+_classes = None
+_score = None
+_cython_score_batch = None
+_onnx_session = None
+
+# Dynamic micro-batching settings: concurrent /predict requests are
+# collected for up to MAX_LATENCY_MS and scored with one predict_proba call.
+# Each request encodes its features straight into the next free row of a
+# preallocated buffer, so a window is handed to the model without copying.
+# MAX_BATCH_SIZE=1 disables batching (every request is scored immediately);
+# MAX_LATENCY_MS=0 only batches requests that arrive in the same loop tick
+MAX_BATCH_SIZE = max(1, int(os.getenv("MAX_BATCH_SIZE", 64)))
+MAX_LATENCY_MS = float(os.getenv("MAX_LATENCY_MS", 10))
+_batch_buffer = np.empty((MAX_BATCH_SIZE, 13), dtype=np.float32)
+_batch_futures = []
+_flush_handle = None
+
+# /predict_batch_fast skips pydantic validation, so it is only registered
+# when ENABLE_FAST_BATCH is set (for deployments whose API port is reachable
+# by the Streamlit frontend alone)
+ENABLE_FAST_BATCH = os.getenv("ENABLE_FAST_BATCH", "").lower() in ("1", "true", "yes")
+
+# LRU cache of (prediction, probability) keyed by the raw claim fields, so
+# repeated payloads skip feature encoding and tree traversal entirely
+PREDICTION_CACHE_SIZE = 4096
+_prediction_cache = OrderedDict()
+
+# Pre-built (1, 13) float32 feature rows with the claim_type one-hot tail
+# (auto, home, health) already set; "other" leaves all three at zero
+CLAIM_TYPES = ('auto', 'home', 'health', 'other')
+_TEMPLATES = {t: np.zeros((1, 13), dtype=np.float32) for t in CLAIM_TYPES}
+for _i, _t in enumerate(CLAIM_TYPES[:3]):
+    _TEMPLATES[_t][0, 10 + _i] = 1
+
+# Numeric claim fields in training column order (feature columns 0-9)
+NUMERIC_FIELDS = (
+    "claim_amount",
+    "claim_age",
+    "claimant_age",
+    "policy_duration",
+    "monthly_premium",
+    "witnesses",
+    "police_report",
+    "injury_claim",
+    "property_claim",
+    "vehicle_claim",
+)
+# Training column order the encoders above produce; the model's saved
+# feature_columns must match it exactly
+FEATURE_COLUMNS = NUMERIC_FIELDS + tuple(f"claim_type_{t}" for t in CLAIM_TYPES[:3])
+_numeric_attrs = attrgetter(*NUMERIC_FIELDS)
+_numeric_items = itemgetter(*NUMERIC_FIELDS)
+
+class SharedTreeModel:
+    """
+    Decision tree arrays stored once in a shared memory block.
+    
+    joblib's mmap_mode does not help for trees: sklearn's Tree copies its
+    node arrays into private memory when unpickled, so every uvicorn worker
+    would hold its own copy. Instead the parent process publishes the
+    arrays once and each worker attaches read-only numpy views to them.
+    """
+    
+    # Block layout after an int64 header (node_count, n_classes)
+    _FIELDS = (
+        ("classes", np.int64),
+        ("children_left", np.int64),
+        ("children_right", np.int64),
+        ("feature", np.int64),
+        ("threshold", np.float64),
+        ("value", np.float64),
+    )
+    _HEADER_BYTES = 16
+    
+    def __init__(self, shm):
+        self.shm = shm
+        self.name = shm.name
+        node_count, n_classes = np.ndarray(2, dtype=np.int64, buffer=shm.buf)
+        offset = self._HEADER_BYTES
+        for field, dtype, shape in self._shapes(node_count, n_classes):
+            view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            view.flags.writeable = False
+            setattr(self, field, view)
+            offset += view.nbytes
+        self.classes_ = self.classes
+    
+    @classmethod
+    def _shapes(cls, node_count, n_classes):
+        shapes = {"classes": (n_classes,), "value": (node_count, n_classes)}
+        for field, dtype in cls._FIELDS:
+            yield field, dtype, shapes.get(field, (node_count,))
+    
+    @classmethod
+    def publish(cls, model):
+        """Copy a fitted DecisionTreeClassifier into a new shared memory block"""
+        if not hasattr(model, "tree_"):
+            raise ValueError("The shared backend requires a DecisionTreeClassifier model")
+        tree = model.tree_
+        value = tree.value[:, 0, :]
+        arrays = {
+            "classes": model.classes_,
+            "children_left": tree.children_left,
+            "children_right": tree.children_right,
+            "feature": tree.feature,
+            "threshold": tree.threshold,
+            "value": value / value.sum(axis=1, keepdims=True),
+        }
+        size = cls._HEADER_BYTES + sum(
+            np.dtype(dtype).itemsize * int(np.prod(shape))
+            for _, dtype, shape in cls._shapes(tree.node_count, value.shape[1])
+        )
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        np.ndarray(2, dtype=np.int64, buffer=shm.buf)[:] = (tree.node_count, value.shape[1])
+        offset = cls._HEADER_BYTES
+        for field, dtype, shape in cls._shapes(tree.node_count, value.shape[1]):
+            target = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            target[:] = arrays[field]
+            offset += target.nbytes
+        return cls(shm)
+    
+    @classmethod
+    def attach(cls, name):
+        """Attach to a block published by another process"""
+        return cls(shared_memory.SharedMemory(name=name))
+    
+    def close(self):
+        """Drop the numpy views and detach from the block"""
+        for field, _ in self._FIELDS:
+            delattr(self, field)
+        del self.classes_
+        self.shm.close()
+    
+    def predict_proba(self, features):
+        """Walk all rows down the tree together, one level per iteration"""
+        rows = np.arange(len(features))
+        nodes = np.zeros(len(features), dtype=np.int64)
+        while True:
+            left = self.children_left[nodes]
+            active = left != -1
+            if not active.any():
+                return self.value[nodes]
+            go_left = features[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(active, np.where(go_left, left, self.children_right[nodes]), nodes)
 
 # Define request schema
 class ClaimData(BaseModel):
     claim_amount: float
     claim_age: int
-    claim_type: str
+    claim_type: Literal['auto', 'home', 'health', 'other']
     claimant_age: int
     policy_duration: float
     monthly_premium: float
@@ -48,8 +242,8 @@ class ClaimData(BaseModel):
     property_claim: int
     vehicle_claim: int
 
-    class Config:
-        example = {
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
             "claim_amount": 5000,
             "claim_age": 30,
             "claim_type": "auto",
@@ -62,6 +256,11 @@ class ClaimData(BaseModel):
             "property_claim": 1,
             "vehicle_claim": 1
         }
+    })
+
+# Static prefixes of the human-readable prediction message
+_FRAUD_PREFIX = "⚠️ Fraud Alert! Confidence: "
+_OK_PREFIX = "✅ Claim appears legitimate. Confidence: "
 
 # Define response schema
 class PredictionResponse(BaseModel):
@@ -70,21 +269,154 @@ class PredictionResponse(BaseModel):
     risk_level: str
     message: str
 
+def _scale_features(features):
+    """Apply the training-time StandardScaler to encoded rows in place (float32)"""
+    features -= _mean32
+    features *= _inv_scale32
+    return features
+
+def _tree_predict_proba(features):
+    """Class probabilities from the low-level tree, skipping sklearn's wrappers"""
+    value = _tree.predict(np.ascontiguousarray(features, dtype=np.float32))
+    return value / value.sum(axis=1, keepdims=True)
+
+def _scorer_predict_proba(features):
+    """Class probabilities from the generated scorer, one plain list per row"""
+    value = np.array([_score(row) for row in features.tolist()])
+    return value / value.sum(axis=1, keepdims=True)
+
+def _onnx_predict_proba(features):
+    """Class probabilities from the onnxruntime session"""
+    return _onnx_session.run(None, {'input': np.ascontiguousarray(features, dtype=np.float32)})[1]
+
+def _cython_predict_proba(features):
+    """
+    Class probabilities from the compiled Cython scorer, which loops over the
+    rows in C and applies the scaler itself, so it takes unscaled rows
+    """
+    proba = np.empty((len(features), 2))
+    _cython_score_batch(np.ascontiguousarray(features, dtype=np.float32), proba)
+    return proba
+
+def _scaled(predict_proba):
+    """Wrap a backend that expects scaled rows so that it takes encoded rows"""
+    def scaled_predict_proba(features):
+        return predict_proba(_scale_features(features))
+    return scaled_predict_proba
+
+# Set by load_model according to MODEL_BACKEND; takes encoded, unscaled
+# float32 rows (scaled in place unless the backend applies the scaler itself)
+_predict_proba = _scaled(_tree_predict_proba)
+
+def _flush_batch():
+    """Score the filled rows of the batch buffer and resolve their futures"""
+    global _flush_handle
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    
+    futures = _batch_futures[:]
+    _batch_futures.clear()
+    if not futures:
+        return
+    
+    try:
+        probabilities = _predict_proba(_batch_buffer[:len(futures)])
+    except Exception as e:
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+        return
+    
+    for future, proba in zip(futures, probabilities):
+        if not future.done():
+            future.set_result(proba)
+
+async def predict_batched(claim):
+    """Encode a claim into the batch buffer and wait for its class probabilities"""
+    global _flush_handle
+    loop = asyncio.get_running_loop()
+    
+    # No await between claiming the slot and registering the future, so the
+    # event loop cannot interleave another request here
+    slot = len(_batch_futures)
+    _encode_claim(claim, _batch_buffer[slot:slot + 1])
+    future = loop.create_future()
+    _batch_futures.append(future)
+    
+    if len(_batch_futures) == MAX_BATCH_SIZE:
+        _flush_batch()
+    elif _flush_handle is None:
+        _flush_handle = loop.call_later(MAX_LATENCY_MS / 1000, _flush_batch)
+    
+    return await future
+
 @app.on_event("startup")
-def load_model():
+async def load_model():
     """Load the trained model on startup"""
-    global model
+    global model, model_algorithm, _tree, _classes, _score, _cython_score_batch, _onnx_session, _predict_proba
+    global _mean32, _inv_scale32
     try:
-        model_path = os.path.join(os.path.dirname(__file__), "../models/fraud_detection_model.pkl")
-        with open(model_path, 'rb') as f:
-            model = pickle.load(f)
-        logger.info("Model loaded successfully!")
+        scaler = np.load(SCALER_PATH)
+        feature_columns = tuple(scaler["feature_columns"].tolist())
+        if feature_columns != FEATURE_COLUMNS:
+            raise ValueError(
+                f"Model was trained on columns {list(feature_columns)}, "
+                f"but the API encodes claims as {list(FEATURE_COLUMNS)}"
+            )
+        _mean32 = scaler["mean"].astype(np.float32)
+        _inv_scale32 = scaler["inv_scale"].astype(np.float32)
+        
+        if MODEL_BACKEND == "shared":
+            shm_name = os.getenv("MODEL_SHM_NAME")
+            if shm_name is None:
+                raise RuntimeError("The shared backend must be started with `python api/main.py`")
+            model = SharedTreeModel.attach(shm_name)
+            # publish() only accepts fitted DecisionTreeClassifier models
+            model_algorithm = "DecisionTreeClassifier"
+        else:
+            # Memory-map numpy arrays read-only; this requires the model file
+            # to be saved uncompressed (see save_model)
+            model = joblib.load(MODEL_PATH, mmap_mode='r')
+            # Only single decision trees expose tree_; ensembles such as
+            # HistGradientBoostingClassifier go through predict_proba
+            _tree = getattr(model, "tree_", None)
+            model_algorithm = type(model).__name__
+        _classes = model.classes_
+        
+        if MODEL_BACKEND == "shared":
+            _predict_proba = _scaled(model.predict_proba)
+        elif MODEL_BACKEND == "python":
+            namespace = {}
+            with open(SCORER_PATH) as f:
+                exec(f.read(), namespace)
+            _score = namespace["score"]
+            _predict_proba = _scaled(_scorer_predict_proba)
+        elif MODEL_BACKEND == "cython":
+            sys.path.insert(0, MODEL_DIR)
+            from fraud_scorer import score_batch as _cython_score_batch
+            _predict_proba = _cython_predict_proba
+        elif MODEL_BACKEND == "onnx":
+            import onnxruntime as ort
+            sess_options = ort.SessionOptions()
+            sess_options.intra_op_num_threads = ONNX_THREADS
+            _onnx_session = ort.InferenceSession(
+                ONNX_PATH, sess_options, providers=['CPUExecutionProvider']
+            )
+            _predict_proba = _scaled(_onnx_predict_proba)
+        elif MODEL_BACKEND == "sklearn":
+            _predict_proba = _scaled(_tree_predict_proba if _tree is not None else model.predict_proba)
+        else:
+            raise ValueError(f"Unknown MODEL_BACKEND: {MODEL_BACKEND}")
+        logger.info(f"Model loaded successfully! (backend: {MODEL_BACKEND})")
     except Exception as e:
         logger.error(f"Error loading model: {str(e)}")
         raise
 
+    _prediction_cache.clear()
+
 @app.get("/", tags=["Health Check"])
-def read_root():
+async def read_root():
     """Health check endpoint"""
     return {
         "status": "healthy",
@@ -93,7 +425,7 @@ def read_root():
     }
 
 @app.get("/health", tags=["Health Check"])
-def health_check():
+async def health_check():
     """Detailed health check with model status"""
     return {
         "status": "operational",
@@ -101,8 +433,39 @@ def health_check():
         "service": "Insurance Fraud Detection API"
     }
 
+def _encode_claim(claim, out):
+    """Write a claim's feature row (training column order) into a (1, 13) view"""
+    out[:] = _TEMPLATES[claim.claim_type]
+    out[0, 0:10] = _numeric_attrs(claim)
+    return out
+
+def _build_response(prediction, probability):
+    """Turn a predicted class and fraud probability into a PredictionResponse"""
+    # Determine risk level
+    if probability < 0.3:
+        risk_level = "Low"
+    elif probability < 0.7:
+        risk_level = "Medium"
+    else:
+        risk_level = "High"
+    
+    fraud_detected = prediction == 1
+    
+    # Generate message
+    if fraud_detected:
+        message = _FRAUD_PREFIX + f"{probability*100:.1f}%"
+    else:
+        message = _OK_PREFIX + f"{(1-probability)*100:.1f}%"
+    
+    return PredictionResponse(
+        fraud_detected=fraud_detected,
+        fraud_probability=probability,
+        risk_level=risk_level,
+        message=message
+    )
+
 @app.post("/predict", response_model=PredictionResponse, tags=["Predictions"])
-def predict_fraud(claim: ClaimData):
+async def predict_fraud(claim: ClaimData):
     """
     Predict if an insurance claim is fraudulent.
     
@@ -116,10 +479,10 @@ def predict_fraud(claim: ClaimData):
         raise HTTPException(status_code=500, detail="Model not loaded")
     
     try:
-        # Prepare feature vector (must match training data order)
-        features = np.array([[
+        key = (
             claim.claim_amount,
             claim.claim_age,
+            claim.claim_type,
             claim.claimant_age,
             claim.policy_duration,
             claim.monthly_premium,
@@ -128,59 +491,144 @@ def predict_fraud(claim: ClaimData):
             claim.injury_claim,
             claim.property_claim,
             claim.vehicle_claim,
-            1 if claim.claim_type.lower() == 'auto' else 0,
-            1 if claim.claim_type.lower() == 'home' else 0,
-            1 if claim.claim_type.lower() == 'health' else 0,
-        ]])
+        )
+        cached = _prediction_cache.get(key)
+        if cached is not None:
+            _prediction_cache.move_to_end(key)
+            return _build_response(*cached)
         
-        # Make prediction
-        prediction = model.predict(features)[0]
-        probability = model.predict_proba(features)[0][1]
+        # Make prediction (batched with concurrent requests)
+        proba = await predict_batched(claim)
+        result = (_classes[np.argmax(proba)], proba[1])
         
-        # Determine risk level
-        if probability < 0.3:
-            risk_level = "Low"
-        elif probability < 0.7:
-            risk_level = "Medium"
-        else:
-            risk_level = "High"
+        _prediction_cache[key] = result
+        if len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+            _prediction_cache.popitem(last=False)
         
-        fraud_detected = prediction == 1
+        return _build_response(*result)
+    except Exception as e:
+        logger.error(f"Prediction error: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Prediction error: {str(e)}")
+
+def _predict_rows(features):
+    """Score encoded feature rows with one model call, one response per row"""
+    probabilities = _predict_proba(features)
+    predictions = _classes[np.argmax(probabilities, axis=1)]
+    
+    return [
+        _build_response(prediction, probability)
+        for prediction, probability in zip(predictions.tolist(), probabilities[:, 1].tolist())
+    ]
+
+def _predict_claim_dicts(claims):
+    """Write unvalidated claim dicts straight into a feature array and score it"""
+    features = np.empty((len(claims), 13), dtype=np.float32)
+    for i, claim in enumerate(claims):
+        features[i] = _TEMPLATES[claim["claim_type"]][0]
+        features[i, 0:10] = _numeric_items(claim)
+    
+    return _predict_rows(features)
+
+# The batch routes encode and score whole lists, which can take a while, so
+# that work runs in the threadpool instead of blocking the event loop that
+# also drives the /predict micro-batcher
+@app.post("/predict_batch", response_model=list[PredictionResponse], tags=["Predictions"])
+def predict_fraud_batch(claims: list[ClaimData]):
+    """
+    Predict fraud for a list of claims with a single model call.
+    
+    Returns one prediction per claim, in request order, with the same
+    fields as /predict.
+    """
+    if model is None:
+        raise HTTPException(status_code=500, detail="Model not loaded")
+    
+    if not claims:
+        return []
+    
+    try:
+        features = np.empty((len(claims), 13), dtype=np.float32)
+        for i, claim in enumerate(claims):
+            _encode_claim(claim, features[i:i + 1])
         
-        # Generate message
-        if fraud_detected:
-            message = f"⚠️ Fraud Alert! Confidence: {probability*100:.1f}%"
-        else:
-            message = f"✅ Claim appears legitimate. Confidence: {(1-probability)*100:.1f}%"
+        return _predict_rows(features)
+    except Exception as e:
+        logger.error(f"Batch prediction error: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Prediction error: {str(e)}")
+
+async def predict_fraud_batch_fast(request: Request):
+    """
+    Predict fraud for a list of claims without per-claim pydantic validation.
+    
+    Intended for trusted internal callers such as the Streamlit frontend;
+    the JSON body is parsed with orjson and written straight into the
+    feature array. Public clients should use /predict_batch. Only served
+    when ENABLE_FAST_BATCH is set.
+    """
+    if model is None:
+        raise HTTPException(status_code=500, detail="Model not loaded")
+    
+    try:
+        claims = orjson.loads(await request.body())
+        if not isinstance(claims, list):
+            raise ValueError("request body must be a JSON list of claims")
+        if not claims:
+            return []
         
-        return PredictionResponse(
-            fraud_detected=fraud_detected,
-            fraud_probability=round(probability, 4),
-            risk_level=risk_level,
-            message=message
-        )
+        return await run_in_threadpool(_predict_claim_dicts, claims)
     except Exception as e:
-        logger.error(f"Prediction error: {str(e)}")
+        logger.error(f"Batch prediction error: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Prediction error: {str(e)}")
 
+if ENABLE_FAST_BATCH:
+    app.post(
+        "/predict_batch_fast", response_model=list[PredictionResponse], tags=["Predictions"]
+    )(predict_fraud_batch_fast)
+
 @app.get("/info", tags=["Information"])
-def get_info():
+async def get_info():
     """Get API information and usage"""
+    endpoints = {
+        "GET /": "Health check",
+        "GET /health": "Detailed health status",
+        "POST /predict": "Predict fraud for a claim",
+        "POST /predict_batch": "Predict fraud for a list of claims",
+        "GET /info": "API information",
+        "GET /docs": "Interactive API documentation (Swagger UI)",
+        "GET /redoc": "ReDoc documentation"
+    }
+    if ENABLE_FAST_BATCH:
+        endpoints["POST /predict_batch_fast"] = "Unvalidated batch prediction for trusted internal callers"
     return {
         "api_name": "Insurance Fraud Detection ML API",
         "version": "1.0.0",
         "description": "Detects fraudulent insurance claims using Machine Learning",
-        "model_accuracy": "93%",
-        "endpoints": {
-            "GET /": "Health check",
-            "GET /health": "Detailed health status",
-            "POST /predict": "Predict fraud for a claim",
-            "GET /info": "API information",
-            "GET /docs": "Interactive API documentation (Swagger UI)",
-            "GET /redoc": "ReDoc documentation"
-        }
+        "model_algorithm": model_algorithm,
+        "endpoints": endpoints
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # The shared backend publishes the tree once here; workers inherit the
+    # block name through the environment and attach to it on startup
+    shared_model = None
+    if MODEL_BACKEND == "shared":
+        shared_model = SharedTreeModel.publish(joblib.load(MODEL_PATH))
+        os.environ["MODEL_SHM_NAME"] = shared_model.name
+    
+    # Multiple workers require the import string rather than the app object,
+    # so each worker re-imports this module and loads the model on startup
+    try:
+        uvicorn.run(
+            "api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=WORKERS,
+            app_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+        )
+    finally:
+        if shared_model is not None:
+            shared_model.close()
+            shared_model.shm.unlink()
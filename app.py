@@ -4,7 +4,7 @@ Interactive UI for detecting fraudulent insurance claims.
 """
 
 import streamlit as st
-import requests
+import httpx
 import json
 from datetime import datetime
 import pandas as pd
@@ -44,6 +44,22 @@ st.markdown("""
 # API Configuration
 API_URL = st.secrets.get("API_URL", "http://localhost:8000") if hasattr(st, "secrets") else "http://localhost:8000"
 
+# Reusable HTTP client so every call shares one keep-alive connection to the API
+if "http" not in st.session_state:
+    st.session_state.http = httpx.Client(
+        base_url=API_URL,
+        timeout=10,
+        transport=httpx.HTTPTransport(retries=1)
+    )
+http = st.session_state.http
+
+# Claim fields expected by the /predict and /predict_batch endpoints
+CLAIM_FIELDS = [
+    "claim_amount", "claim_age", "claim_type", "claimant_age",
+    "policy_duration", "monthly_premium", "witnesses", "police_report",
+    "injury_claim", "property_claim", "vehicle_claim",
+]
+
 # App title and header
 st.title("🔍 Insurance Fraud Detection System")
 st.markdown("---")
@@ -52,12 +68,20 @@ st.markdown("---")
 with st.sidebar:
     st.header("⚙️ Settings")
     api_status = st.empty()
+    model_algorithm = "unknown"
+    batch_endpoint = "/predict_batch"
     
     # API Health Check
     try:
-        response = requests.get(f"{API_URL}/health", timeout=2)
+        response = http.get("/health", timeout=2)
         if response.status_code == 200:
             api_status.success("✅ API Connected")
+            # Estimator class of the model the API has loaded, and whether it
+            # serves the unvalidated batch route (ENABLE_FAST_BATCH)
+            info = http.get("/info", timeout=2).json()
+            model_algorithm = info.get("model_algorithm") or "unknown"
+            if "POST /predict_batch_fast" in info.get("endpoints", {}):
+                batch_endpoint = "/predict_batch_fast"
         else:
             api_status.error("❌ API Error")
     except:
@@ -65,8 +89,8 @@ with st.sidebar:
     
     st.markdown("---")
     st.subheader("About")
-    st.info("""
-    This system uses Machine Learning (Decision Tree) to detect fraudulent insurance claims with **93% accuracy**.
+    st.info(f"""
+    This system uses Machine Learning ({model_algorithm}) to detect fraudulent insurance claims.
     
     **Key Features:**
     - Real-time fraud detection
@@ -171,11 +195,7 @@ with tab1:
             }
             
             # Make API call
-            response = requests.post(
-                f"{API_URL}/predict",
-                json=payload,
-                timeout=10
-            )
+            response = http.post("/predict", json=payload)
             
             if response.status_code == 200:
                 result = response.json()
@@ -240,7 +260,7 @@ with tab1:
                     """)
             else:
                 st.error(f"API Error: {response.status_code}")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             st.error("❌ Cannot connect to API. Make sure the backend is running.")
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
@@ -253,18 +273,44 @@ with tab2:
     if uploaded_file is not None:
         df = pd.read_csv(uploaded_file)
         st.dataframe(df, use_container_width=True)
+        
+        missing_cols = [col for col in CLAIM_FIELDS if col not in df.columns]
+        if missing_cols:
+            st.warning(f"Missing columns for analysis: {', '.join(missing_cols)}")
+        elif st.button("🔍 Analyze Batch", key="predict_batch", use_container_width=True):
+            try:
+                # Send every claim in a single request so the API scores them together
+                response = http.post(
+                    batch_endpoint,
+                    json=df[CLAIM_FIELDS].to_dict(orient="records"),
+                    timeout=30
+                )
+                
+                if response.status_code == 200:
+                    results = pd.DataFrame(response.json())
+                    
+                    st.markdown("---")
+                    st.subheader("✅ Batch Results")
+                    
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Claims Analyzed", len(results))
+                    col2.metric("Fraud Detected", int(results["fraud_detected"].sum()))
+                    col3.metric("High Risk", int((results["risk_level"] == "High").sum()))
+                    
+                    st.dataframe(
+                        pd.concat([df.reset_index(drop=True), results], axis=1),
+                        use_container_width=True
+                    )
+                else:
+                    st.error(f"API Error: {response.status_code}")
+            except httpx.ConnectError:
+                st.error("❌ Cannot connect to API. Make sure the backend is running.")
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
 
 with tab3:
     st.subheader("System Analytics")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    col1.metric("Model Accuracy", "93%")
-    col2.metric("Precision", "92%")
-    col3.metric("Recall", "91%")
-    col4.metric("F1-Score", "0.92")
-    
-    st.markdown("---")
-    st.info("**Model Information:**\n- Algorithm: Decision Tree Classifier\n- Training Data: Insurance Claims Dataset\n- Last Updated: 2025")
+    st.info(f"**Model Information:**\n- Algorithm: {model_algorithm}\n- Training Data: Insurance Claims Dataset\n- Last Updated: 2025")
 
 # Footer
 st.markdown("---")
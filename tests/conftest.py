@@ -0,0 +1,34 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Make the `api` and `src` packages importable when running pytest from any directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import api.main as main
+from src.model import FraudDetectionModel
+
+
+@pytest.fixture
+def trained_model(tmp_path, monkeypatch):
+    """
+    Fit a small model on the API's 13-column layout, save it under tmp_path
+    and point api.main at it; returns a function taking the algorithm
+    """
+    def train(algorithm="decision_tree"):
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame(rng.random((500, 13)), columns=list(main.FEATURE_COLUMNS))
+        X[list(main.NUMERIC_FIELDS)] *= [20000, 365, 90, 30, 500, 4, 1, 1, 1, 1]
+        y = ((X["claim_amount"] > 10000) ^ (X["witnesses"] < 1)).astype(int)
+        
+        fdm = FraudDetectionModel()
+        fdm.train(X, y, algorithm=algorithm)
+        path = tmp_path / "fraud_detection_model.pkl"
+        fdm.save_model(str(path))
+        monkeypatch.setattr(main, "MODEL_PATH", str(path))
+        monkeypatch.setattr(main, "SCALER_PATH", str(tmp_path / "fraud_detection_model_scaler.npz"))
+        return fdm
+    return train
@@ -0,0 +1,71 @@
+"""Concurrent /predict calls are micro-batched without changing results"""
+
+import asyncio
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+
+import api.main as main
+
+
+def _claims(n):
+    rng = np.random.default_rng(1)
+    return [
+        {
+            "claim_amount": float(rng.uniform(0, 20000)),
+            "claim_age": int(rng.integers(0, 365)),
+            "claim_type": str(rng.choice(main.CLAIM_TYPES)),
+            "claimant_age": int(rng.integers(18, 90)),
+            "policy_duration": float(rng.uniform(0.1, 30)),
+            "monthly_premium": float(rng.uniform(10, 500)),
+            "witnesses": int(rng.integers(0, 4)),
+            "police_report": int(rng.integers(0, 2)),
+            "injury_claim": int(rng.integers(0, 2)),
+            "property_claim": int(rng.integers(0, 2)),
+            "vehicle_claim": int(rng.integers(0, 2)),
+        }
+        for _ in range(n)
+    ]
+
+
+def _frame(claims):
+    """Claims as the DataFrame layout the model was trained on"""
+    df = pd.DataFrame(claims)
+    for claim_type in ("auto", "home", "health"):
+        df[f"claim_type_{claim_type}"] = (df["claim_type"] == claim_type).astype(float)
+    return df[list(main.FEATURE_COLUMNS)]
+
+
+# decision_tree is scored through tree_.predict, hist_gbt through the
+# estimator's predict_proba
+@pytest.mark.parametrize("algorithm", ["decision_tree", "hist_gbt"])
+def test_concurrent_predict_matches_model_predict(trained_model, monkeypatch, algorithm):
+    fdm = trained_model(algorithm)
+    claims = _claims(40)
+    
+    async def run():
+        await main.load_model()
+        
+        calls = []
+        predict_proba = main._predict_proba
+        def counting_predict_proba(features):
+            calls.append(len(features))
+            return predict_proba(features)
+        monkeypatch.setattr(main, "_predict_proba", counting_predict_proba)
+        
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(client.post("/predict", json=c) for c in claims))
+        return [r.json() for r in responses], calls
+    
+    results, calls = asyncio.run(run())
+    
+    # Reference: the training-side DataFrame path of FraudDetectionModel
+    predictions, probabilities = fdm.predict(_frame(claims))
+    
+    assert len(calls) < len(claims)
+    assert sum(calls) == len(claims)
+    np.testing.assert_allclose([r["fraud_probability"] for r in results], probabilities[:, 1], rtol=1e-6)
+    assert [r["fraud_detected"] for r in results] == (predictions == 1).tolist()
@@ -0,0 +1,20 @@
+"""claim_type only accepts the four lowercase types the encoder knows"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as main
+
+CLAIM = main.ClaimData.model_config["json_schema_extra"]["example"]
+
+
+@pytest.mark.parametrize("claim_type", ["Auto", "travel"])
+def test_unknown_claim_type_is_rejected(trained_model, claim_type):
+    trained_model()
+    claim = {**CLAIM, "claim_type": claim_type}
+    with TestClient(main.app) as client:
+        single = client.post("/predict", json=claim)
+        batch = client.post("/predict_batch", json=[CLAIM, claim])
+    
+    assert single.status_code == 422
+    assert batch.status_code == 422
@@ -0,0 +1,46 @@
+"""Repeated /predict payloads are answered from the LRU prediction cache"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import api.main as main
+
+CLAIM = main.ClaimData.model_config["json_schema_extra"]["example"]
+
+
+def _count_predict_proba(monkeypatch):
+    calls = []
+    predict_proba = main._predict_proba
+    def counting_predict_proba(features):
+        calls.append(len(features))
+        return predict_proba(features)
+    monkeypatch.setattr(main, "_predict_proba", counting_predict_proba)
+    return calls
+
+
+def test_repeated_payload_skips_the_model(trained_model, monkeypatch):
+    trained_model()
+    with TestClient(main.app) as client:
+        calls = _count_predict_proba(monkeypatch)
+        first = client.post("/predict", json=CLAIM)
+        second = client.post("/predict", json=CLAIM)
+    
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert calls == [1]
+
+
+def test_load_model_clears_the_cache(trained_model, monkeypatch):
+    trained_model()
+    with TestClient(main.app) as client:
+        client.post("/predict", json=CLAIM)
+        assert main._prediction_cache
+        
+        asyncio.run(main.load_model())
+        assert not main._prediction_cache
+        
+        calls = _count_predict_proba(monkeypatch)
+        client.post("/predict", json=CLAIM)
+    
+    assert calls == [1]
@@ -0,0 +1,24 @@
+"""SharedTreeModel reproduces the fitted tree from its shared memory copy"""
+
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+
+from api.main import SharedTreeModel
+
+
+def test_shared_tree_matches_sklearn_predict_proba():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 13)).astype(np.float32)
+    y = (X[:, 0] + X[:, 3] * X[:, 7] > 0).astype(int)
+    model = DecisionTreeClassifier(max_depth=6, random_state=0).fit(X, y)
+    
+    published = SharedTreeModel.publish(model)
+    attached = SharedTreeModel.attach(published.name)
+    try:
+        X_test = rng.normal(size=(50, 13)).astype(np.float32)
+        np.testing.assert_array_equal(attached.classes_, model.classes_)
+        np.testing.assert_allclose(attached.predict_proba(X_test), model.predict_proba(X_test))
+    finally:
+        attached.close()
+        published.close()
+        published.shm.unlink()